@@ -62,7 +62,6 @@ def get(url, params=None, **kwargs):
     :return: :class:`Response <Response>` object
     :rtype: rapidhttp.Response
     """
-    kwargs.setdefault('allow_redirects', True)
     return request('GET', url, params=params, **kwargs)
 
 
@@ -74,7 +73,6 @@ def options(url, **kwargs):
     :return: :class:`Response <Response>` object
     :rtype: rapidhttp.Response
     """
-    kwargs.setdefault('allow_redirects', True)
     return request('OPTIONS', url, **kwargs)
 
 
@@ -104,7 +102,6 @@ def post(url, data=None, json=None, **kwargs):
     :return: :class:`Response <Response>` object
     :rtype: rapidhttp.Response
     """
-    kwargs.setdefault('allow_redirects', True)
     return request('POST', url, data=data, json=json, **kwargs)
 
 
@@ -120,7 +117,6 @@ def put(url, data=None, **kwargs):
     :return: :class:`Response <Response>` object
     :rtype: rapidhttp.Response
     """
-    kwargs.setdefault('allow_redirects', True)
     return request('PUT', url, data=data, **kwargs)
 
 
@@ -136,7 +132,6 @@ def patch(url, data=None, **kwargs):
     :return: :class:`Response <Response>` object
     :rtype: rapidhttp.Response
     """
-    kwargs.setdefault('allow_redirects', True)
     return request('PATCH', url, data=data, **kwargs)
 
 
@@ -148,5 +143,4 @@ def delete(url, **kwargs):
     :return: :class:`Response <Response>` object
     :rtype: rapidhttp.Response
     """
-    kwargs.setdefault('allow_redirects', True)
     return request('DELETE', url, **kwargs)
@@ -5,8 +5,79 @@ rapidhttp.models
 This module contains the primary objects for requests compatibility.
 """
 
+import io
+import re
+
 from ._rapidhttp import Response as _RustResponse
 
+# Use orjson for 3-5x faster JSON decoding, resolved once at import time
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    # Fallback to standard library if orjson not available
+    from json import loads as _json_loads
+
+# Reason phrases for common status codes
+_STATUS_REASONS = {
+    200: 'OK',
+    201: 'Created',
+    204: 'No Content',
+    301: 'Moved Permanently',
+    302: 'Found',
+    304: 'Not Modified',
+    400: 'Bad Request',
+    401: 'Unauthorized',
+    403: 'Forbidden',
+    404: 'Not Found',
+    500: 'Internal Server Error',
+    502: 'Bad Gateway',
+    503: 'Service Unavailable',
+}
+
+# Status codes checked before touching the (FFI-backed) headers
+_REDIRECT_CODES = frozenset((301, 302, 303, 307, 308))
+_PERMANENT_REDIRECT_CODES = frozenset((301, 308))
+
+# Marks a lazily computed Response attribute as not fetched yet; unlike None
+# it cannot collide with a decoded JSON ``null``
+_MISSING = object()
+
+# Prebuilt one-byte chunks for iter_content(chunk_size=1)
+_SINGLE_BYTES = tuple(bytes((i,)) for i in range(256))
+
+# iter_lines splits the body one window of roughly this many bytes at a time
+_LINE_WINDOW = 64 * 1024
+_LINE_BREAK = re.compile(rb'\r\n|\r|\n')
+
+
+def _split_lines(content):
+    """Lazily yield the lines of content exactly as ``content.splitlines()``
+    would, without building the list for the whole body.
+
+    Each window is cut just after a line break, so ``\\r\\n`` is never split
+    across two windows, and is then split in C.
+    """
+    rfind = content.rfind
+    start = 0
+    end_of_content = len(content)
+    while start < end_of_content:
+        stop = start + _LINE_WINDOW
+        if stop >= end_of_content:
+            stop = end_of_content
+        else:
+            cut = max(rfind(b'\n', start, stop), rfind(b'\r', start, stop))
+            if cut == -1:
+                # No break inside the window, cut after the next one instead
+                match = _LINE_BREAK.search(content, stop)
+                stop = match.end() if match else end_of_content
+            else:
+                stop = cut + 1
+                # Keep a \r\n pair straddling the window edge together
+                if content[cut] == 0x0d and content[stop:stop + 1] == b'\n':
+                    stop += 1
+        yield from content[start:stop].splitlines()
+        start = stop
+
 
 class Response:
     """The :class:`Response <Response>` object, which contains a server's response to an HTTP request.
@@ -14,39 +85,43 @@ class Response:
     This is a wrapper around the Rust response object that provides the requests-compatible API.
     """
     
+    __slots__ = (
+        '_rust_response', 'status_code', 'url', '_headers', '_content', '_text', '_json',
+        '__weakref__',
+    )
+    
     def __init__(self, rust_response):
         """Initialize with a Rust response object."""
         self._rust_response = rust_response
-        self._content = None
-        self._text = None
-        self._json = None
-    
-    @property
-    def status_code(self):
-        """Integer Code of responded HTTP Status, e.g. 404 or 200."""
-        return self._rust_response.status_code
-    
-    @property
-    def url(self):
-        """Final URL location of Response."""
-        return self._rust_response.url
+        # Snapshot the cheap scalars once instead of crossing FFI per access
+        #: Integer Code of responded HTTP Status, e.g. 404 or 200.
+        self.status_code = rust_response.status_code
+        #: Final URL location of Response.
+        self.url = rust_response.url
+        self._headers = _MISSING
+        self._content = _MISSING
+        self._text = _MISSING
+        self._json = _MISSING
     
     @property
     def headers(self):
         """Case-insensitive Dictionary of Response Headers."""
-        return self._rust_response.headers
+        # The Rust getter builds a new dict per call, so fetch it once
+        if self._headers is _MISSING:
+            self._headers = self._rust_response.headers
+        return self._headers
     
     @property
     def content(self):
         """Content of the response, in bytes."""
-        if self._content is None:
+        if self._content is _MISSING:
             self._content = self._rust_response.content()
         return self._content
     
     @property
     def text(self):
         """Content of the response, in unicode."""
-        if self._text is None:
+        if self._text is _MISSING:
             self._text = self._rust_response.text()
         return self._text
     
@@ -68,20 +143,18 @@ class Response:
         :param \\*\\*kwargs: Optional arguments that ``json.loads`` takes.
         :raises ValueError: If the response body does not contain valid json.
         """
-        if self._json is None:
-            # Use orjson for 3-5x faster JSON decoding
-            try:
-                import orjson
-                self._json = orjson.loads(self.content)
-            except ImportError:
-                # Fallback to standard library if orjson not available
-                import json
-                self._json = json.loads(self.text)
+        if self._json is _MISSING:
+            # Decode straight from the raw bytes, never via an intermediate str
+            content = self._content
+            if content is _MISSING:
+                content = self._content = self._rust_response.content()
+            self._json = _json_loads(content)
         return self._json
     
     def raise_for_status(self):
         """Raises :class:`HTTPError`, if one occurred."""
-        self._rust_response.raise_for_status()
+        if self.status_code >= 400:
+            self._rust_response.raise_for_status()
     
     @property
     def ok(self):
@@ -93,12 +166,12 @@ class Response:
         """True if this Response is a well-formed HTTP redirect that could have
         been processed automatically (by :meth:`Session.resolve_redirects`).
         """
-        return 'location' in self.headers and self.status_code in (301, 302, 303, 307, 308)
+        return self.status_code in _REDIRECT_CODES and 'location' in self.headers
     
     @property
     def is_permanent_redirect(self):
         """True if this Response one of the permanent versions of redirect."""
-        return 'location' in self.headers and self.status_code in (301, 308)
+        return self.status_code in _PERMANENT_REDIRECT_CODES and 'location' in self.headers
     
     @property
     def apparent_encoding(self):
@@ -115,21 +188,63 @@ class Response:
         :param decode_unicode: If True, content will be decoded using the best
             available encoding based on the response.
         """
-        # For now, yield the entire content
+        # For now, chunk the buffered content
         # In a full implementation, this would stream from Rust
         content = self.content
+        if chunk_size is None or chunk_size >= len(content):
+            # Single chunk, hand back the cached bytes without copying
+            if content:
+                yield content
+            return
+        if chunk_size == 1:
+            # Table lookup per byte instead of an allocation per byte
+            yield from map(_SINGLE_BYTES.__getitem__, content)
+            return
         for i in range(0, len(content), chunk_size):
-            yield content[i:i+chunk_size]
-    
+            yield content[i:i + chunk_size]
+
     def iter_lines(self, chunk_size=512, decode_unicode=False, delimiter=None):
         """Iterates over the response data, one line at a time.  When
         stream=True is set on the request, this avoids reading the content
         at once into memory for large responses.
         """
-        # Simple implementation
-        text = self.text
-        for line in text.splitlines():
-            yield line
+        content = self.content
+        encoding = self.encoding
+        if delimiter is None:
+            # Break on \n, \r\n and lone \r, like requests does
+            lines = _split_lines(content)
+            if decode_unicode:
+                lines = (line.decode(encoding) for line in lines)
+            yield from lines
+            return
+        # Custom delimiter, scan the raw bytes for it
+        if isinstance(delimiter, str):
+            delimiter = delimiter.encode(encoding)
+        if not delimiter:
+            raise ValueError('empty delimiter')
+        find = content.find
+        step = len(delimiter)
+        start = 0
+        end_of_content = len(content)
+        while start < end_of_content:
+            end = find(delimiter, start)
+            if end == -1:
+                end = end_of_content
+            line = content[start:end]
+            yield line.decode(encoding) if decode_unicode else line
+            start = end + step
+    
+    def iter_json_lines(self):
+        """Iterates over a newline-delimited JSON (NDJSON) body, yielding one
+        decoded object per line. Blank lines are skipped.
+
+        :raises ValueError: If a line does not contain valid json.
+        """
+        loads = _json_loads
+        for line in io.BytesIO(self.content):
+            # Both parsers accept the trailing newline as whitespace
+            if not line.isspace():
+                yield loads(line)
     
     @property
     def cookies(self):
@@ -164,23 +279,7 @@ class Response:
     @property
     def reason(self):
         """Textual reason of responded HTTP Status, e.g. "Not Found" or "OK"."""
-        # Map common status codes
-        status_reasons = {
-            200: 'OK',
-            201: 'Created',
-            204: 'No Content',
-            301: 'Moved Permanently',
-            302: 'Found',
-            304: 'Not Modified',
-            400: 'Bad Request',
-            401: 'Unauthorized',
-            403: 'Forbidden',
-            404: 'Not Found',
-            500: 'Internal Server Error',
-            502: 'Bad Gateway',
-            503: 'Service Unavailable',
-        }
-        return status_reasons.get(self.status_code, '')
+        return _STATUS_REASONS.get(self.status_code, '')
     
     def __repr__(self):
         return f'<Response [{self.status_code}]>'
@@ -197,6 +296,11 @@ class Response:
 class Request:
     """A user-created :class:`Request <Request>` object."""
     
+    __slots__ = (
+        'method', 'url', 'headers', 'files', 'data', 'json',
+        'params', 'auth', 'cookies', 'hooks', '__weakref__',
+    )
+    
     def __init__(self, method=None, url=None, headers=None, files=None,
                  data=None, params=None, auth=None, cookies=None, hooks=None, json=None):
         self.method = method
@@ -217,6 +321,8 @@ class Request:
 class PreparedRequest:
     """The fully prepared :class:`PreparedRequest <PreparedRequest>` object."""
     
+    __slots__ = ('method', 'url', 'headers', 'body', 'hooks', '__weakref__')
+    
     def __init__(self):
         self.method = None
         self.url = None
@@ -8,6 +8,47 @@ This module provides a Session object to persist parameters across requests.
 from ._rapidhttp import request as _rust_request
 from .models import Response
 
+# Canonical method strings, so the common spellings skip str.upper()
+_METHOD_CACHE = {m: m for m in ('GET', 'POST', 'PUT', 'PATCH', 'DELETE', 'HEAD', 'OPTIONS')}
+_METHOD_CACHE.update({m.lower(): m for m in list(_METHOD_CACHE)})
+
+
+def _as_dict(value):
+    """Return headers or params as a plain dict, the only type the Rust layer
+    accepts, or ``None`` if empty.
+
+    Dicts pass through uncopied; lists of pairs and other mappings are
+    converted the way ``dict.update`` would.
+    """
+    if not value:
+        return None
+    if type(value) is dict:
+        return value
+    return dict(value)
+
+
+class _LazyDict:
+    """Session attribute backed by a slot that holds ``None`` until first use.
+
+    Reading the attribute allocates the empty dict on demand, so a session
+    that never touches it never pays for it.
+    """
+    
+    def __set_name__(self, owner, name):
+        self.slot = '_' + name
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = getattr(obj, self.slot)
+        if value is None:
+            value = {}
+            setattr(obj, self.slot, value)
+        return value
+    
+    def __set__(self, obj, value):
+        setattr(obj, self.slot, value)
+
 
 class Session:
     """A requests-compatible Session object.
@@ -22,16 +63,29 @@ class Session:
       <Response [200]>
     """
     
+    __slots__ = (
+        '_headers', '_cookies', 'auth', '_proxies', '_hooks', '_params',
+        'verify', 'cert', '_adapters', 'stream', 'trust_env', 'max_redirects',
+        '__weakref__',
+    )
+    
+    headers = _LazyDict()
+    cookies = _LazyDict()
+    proxies = _LazyDict()
+    hooks = _LazyDict()
+    params = _LazyDict()
+    adapters = _LazyDict()
+    
     def __init__(self):
-        self.headers = {}
-        self.cookies = {}
+        self._headers = None
+        self._cookies = None
         self.auth = None
-        self.proxies = {}
-        self.hooks = {}
-        self.params = {}
+        self._proxies = None
+        self._hooks = None
+        self._params = None
         self.verify = True
         self.cert = None
-        self.adapters = {}
+        self._adapters = None
         self.stream = False
         self.trust_env = True
         self.max_redirects = 30
@@ -75,17 +129,41 @@ class Session:
         :rtype: rapidhttp.Response
         """
         
-        # Merge session headers with request headers
-        merged_headers = {}
-        merged_headers.update(self.headers)
-        if headers:
-            merged_headers.update(headers)
+        session_headers = self._headers
+        session_params = self._params
+        
+        # Fast path for sessions without headers or params (e.g. rapidhttp.get):
+        # nothing to merge, and only verify has a session default the Rust layer uses
+        if not session_headers and not session_params:
+            if verify is None:
+                verify = self.verify
+            return Response(_rust_request(
+                method=_METHOD_CACHE.get(method) or method.upper(),
+                url=url,
+                params=_as_dict(params),
+                headers=_as_dict(headers),
+                data=data,
+                json=json,
+                timeout=timeout,
+                allow_redirects=allow_redirects,
+                verify=verify,
+            ))
+        
+        # Merge session headers with request headers, copying only when both are set
+        if not session_headers:
+            merged_headers = _as_dict(headers)
+        elif not headers:
+            merged_headers = _as_dict(session_headers)
+        else:
+            merged_headers = {**session_headers, **_as_dict(headers)}
         
         # Merge session params with request params
-        merged_params = {}
-        merged_params.update(self.params)
-        if params:
-            merged_params.update(params)
+        if not session_params:
+            merged_params = _as_dict(params)
+        elif not params:
+            merged_params = _as_dict(session_params)
+        else:
+            merged_params = {**session_params, **_as_dict(params)}
         
         # Use session defaults if not overridden
         if verify is None:
@@ -95,16 +173,16 @@ class Session:
         if stream is None:
             stream = self.stream
         if proxies is None:
-            proxies = self.proxies
+            proxies = self._proxies
         if auth is None:
             auth = self.auth
             
         # Call the Rust implementation
         rust_response = _rust_request(
-            method=method.upper(),
+            method=_METHOD_CACHE.get(method) or method.upper(),
             url=url,
-            params=merged_params if merged_params else None,
-            headers=merged_headers if merged_headers else None,
+            params=merged_params,
+            headers=merged_headers,
             data=data,
             json=json,
             timeout=timeout,
@@ -122,7 +200,6 @@ class Session:
         :param \\*\\*kwargs: Optional arguments that ``request`` takes.
         :rtype: rapidhttp.Response
         """
-        kwargs.setdefault('allow_redirects', True)
         return self.request('GET', url, **kwargs)
 
     def options(self, url, **kwargs):
@@ -132,7 +209,6 @@ class Session:
         :param \\*\\*kwargs: Optional arguments that ``request`` takes.
         :rtype: rapidhttp.Response
         """
-        kwargs.setdefault('allow_redirects', True)
         return self.request('OPTIONS', url, **kwargs)
 
     def head(self, url, **kwargs):
@@ -154,7 +230,6 @@ class Session:
         :param \\*\\*kwargs: Optional arguments that ``request`` takes.
         :rtype: rapidhttp.Response
         """
-        kwargs.setdefault('allow_redirects', True)
         return self.request('POST', url, data=data, json=json, **kwargs)
 
     def put(self, url, data=None, **kwargs):
@@ -165,7 +240,6 @@ class Session:
         :param \\*\\*kwargs: Optional arguments that ``request`` takes.
         :rtype: rapidhttp.Response
         """
-        kwargs.setdefault('allow_redirects', True)
         return self.request('PUT', url, data=data, **kwargs)
 
     def patch(self, url, data=None, **kwargs):
@@ -176,7 +250,6 @@ class Session:
         :param \\*\\*kwargs: Optional arguments that ``request`` takes.
         :rtype: rapidhttp.Response
         """
-        kwargs.setdefault('allow_redirects', True)
         return self.request('PATCH', url, data=data, **kwargs)
 
     def delete(self, url, **kwargs):
@@ -186,7 +259,6 @@ class Session:
         :param \\*\\*kwargs: Optional arguments that ``request`` takes.
         :rtype: rapidhttp.Response
         """
-        kwargs.setdefault('allow_redirects', True)
         return self.request('DELETE', url, **kwargs)
     
     def close(self):
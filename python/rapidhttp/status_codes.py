@@ -7,13 +7,20 @@ This module provides HTTP status code lookups.
 
 
 class _Codes(dict):
-    """Provides dot-notation access to HTTP status codes."""
+    """Provides dot-notation access to HTTP status codes.
+
+    Names are mirrored into the instance ``__dict__`` so ``codes.ok`` is a
+    plain attribute load; ``__getattr__`` only runs for unknown names.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__dict__.update(
+            (name, code) for name, code in self.items() if isinstance(name, str)
+        )
     
     def __getattr__(self, name):
-        try:
-            return self[name]
-        except KeyError:
-            raise AttributeError(f"No status code: {name}")
+        raise AttributeError(f"No status code: {name}")
 
 
 # HTTP status codes
@@ -133,7 +140,6 @@ codes = _Codes({
 })
 
 # Add reverse lookups (by code number)
-for name, code in list(codes.items()):
-    codes[code] = code
+codes.update({code: code for code in codes.values()})
 
 __all__ = ['codes']
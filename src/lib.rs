@@ -1,5 +1,5 @@
 use pyo3::prelude::*;
-use pyo3::types::{PyBytes, PyDict};
+use pyo3::types::{PyBytes, PyDict, PyString};
 use pyo3::exceptions::{PyException, PyValueError, PyRuntimeError};
 use reqwest::blocking::Client as BlockingClient;
 use std::collections::HashMap;
@@ -272,9 +272,12 @@ impl Response {
         Ok(dict.into())
     }
 
-    fn text(&mut self) -> PyResult<String> {
+    fn text(&mut self, py: Python) -> PyResult<PyObject> {
         if let Some(ref body) = self.body {
-            String::from_utf8(body.to_vec())
+            // Validate in place and build the str straight from the body,
+            // without an intermediate Vec copy
+            std::str::from_utf8(body)
+                .map(|text| PyString::new(py, text).into())
                 .map_err(|e| PyRuntimeError::new_err(format!("Failed to decode UTF-8: {}", e)))
         } else {
             Err(PyRuntimeError::new_err("Response body already consumed"))
@@ -4,13 +4,21 @@ Simple test server for benchmarking
 Supports GET and POST /echo endpoints
 """
 
-from http.server import HTTPServer, BaseHTTPRequestHandler
-import json
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import orjson
+
+# Upper bound for a single socket read while receiving a request body
+READ_CHUNK_SIZE = 64 * 1024
 
 
 class TestHandler(BaseHTTPRequestHandler):
     """Simple request handler for testing"""
 
+    # Keep connections open so pooling clients can reuse them. Headers and body
+    # go out in separate writes, so disable Nagle to avoid delayed-ACK stalls
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
     def log_message(self, format, *args):
         """Suppress default logging"""
         pass
@@ -19,6 +27,7 @@ class TestHandler(BaseHTTPRequestHandler):
         """Handle GET requests"""
         self.send_response(200)
         self.send_header('Content-Type', 'text/plain')
+        self.send_header('Content-Length', '2')
         self.end_headers()
         self.wfile.write(b'OK')
 
@@ -26,26 +35,34 @@ class TestHandler(BaseHTTPRequestHandler):
         """Handle POST requests - echo back JSON"""
         content_length = int(self.headers.get('Content-Length', 0))
 
-        # Read body
-        body = self.rfile.read(content_length)
+        # Read body in bounded chunks into one preallocated buffer
+        buffer = bytearray(content_length)
+        view = memoryview(buffer)
+        received = 0
+        while received < content_length:
+            n = self.rfile.readinto(view[received:received + READ_CHUNK_SIZE])
+            if not n:
+                break
+            received += n
+        body = view[:received]
 
         # Parse JSON if Content-Type is application/json
         content_type = self.headers.get('Content-Type', '')
 
         if 'application/json' in content_type:
             try:
-                # Parse and echo back the JSON
-                data = json.loads(body)
-                response = json.dumps(data).encode('utf-8')
+                # Validate, then echo the original bytes instead of re-serializing
+                orjson.loads(body)
 
                 self.send_response(200)
                 self.send_header('Content-Type', 'application/json')
-                self.send_header('Content-Length', str(len(response)))
+                self.send_header('Content-Length', str(len(body)))
                 self.end_headers()
-                self.wfile.write(response)
-            except json.JSONDecodeError:
+                self.wfile.write(body)
+            except orjson.JSONDecodeError:
                 self.send_response(400)
                 self.send_header('Content-Type', 'text/plain')
+                self.send_header('Content-Length', '12')
                 self.end_headers()
                 self.wfile.write(b'Invalid JSON')
         else:
@@ -59,7 +76,7 @@ class TestHandler(BaseHTTPRequestHandler):
 
 def run_server(port=8000):
     """Start the test server"""
-    server = HTTPServer(('127.0.0.1', port), TestHandler)
+    server = ThreadingHTTPServer(('127.0.0.1', port), TestHandler)
     print(f"Test server running on http://127.0.0.1:{port}/")
     print("Press Ctrl+C to stop")
 
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+ASGI test server for benchmarking
+Same GET and POST /echo endpoints as test_server.py, served by uvicorn
+(httptools + uvloop when installed) so the server is not the bottleneck
+"""
+
+import orjson
+
+_OK_START = {
+    'type': 'http.response.start',
+    'status': 200,
+    'headers': [(b'content-type', b'text/plain'), (b'content-length', b'2')],
+}
+_OK_BODY = {'type': 'http.response.body', 'body': b'OK'}
+
+_INVALID_START = {
+    'type': 'http.response.start',
+    'status': 400,
+    'headers': [(b'content-type', b'text/plain'), (b'content-length', b'12')],
+}
+_INVALID_BODY = {'type': 'http.response.body', 'body': b'Invalid JSON'}
+
+
+async def read_body(receive):
+    """Collect the full request body"""
+    message = await receive()
+    body = message.get('body', b'')
+    if not message.get('more_body', False):
+        return body
+    chunks = [body]
+    while message.get('more_body', False):
+        message = await receive()
+        chunks.append(message.get('body', b''))
+    return b''.join(chunks)
+
+
+async def app(scope, receive, send):
+    """Handle GET and POST requests"""
+    if scope['type'] != 'http':
+        return
+
+    if scope['method'] != 'POST':
+        await send(_OK_START)
+        await send(_OK_BODY)
+        return
+
+    # Echo back the body; JSON bodies are validated first
+    body = await read_body(receive)
+    content_type = b''
+    for name, value in scope['headers']:
+        if name == b'content-type':
+            content_type = value
+            break
+
+    if b'application/json' in content_type:
+        try:
+            orjson.loads(body)
+        except orjson.JSONDecodeError:
+            await send(_INVALID_START)
+            await send(_INVALID_BODY)
+            return
+
+    await send({
+        'type': 'http.response.start',
+        'status': 200,
+        'headers': [
+            (b'content-type', content_type or b'text/plain'),
+            (b'content-length', str(len(body)).encode()),
+        ],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+def run_server(port=8000):
+    """Start the test server, falling back to test_server.py without uvicorn"""
+    try:
+        import uvicorn
+    except ImportError:
+        import test_server
+        print("uvicorn not installed, using the stdlib test server")
+        test_server.run_server(port)
+        return
+
+    print(f"Test server running on http://127.0.0.1:{port}/")
+    print("Press Ctrl+C to stop")
+    # 'auto' picks uvloop and httptools when they are installed
+    uvicorn.run(app, host='127.0.0.1', port=port, log_level='warning',
+                loop='auto', http='auto')
+
+
+if __name__ == '__main__':
+    run_server()